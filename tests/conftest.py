@@ -0,0 +1,14 @@
+"""
+pytest configuration shared by every suite under tests/.
+
+Puts the tests directory on sys.path so the pytest suites in
+subdirectories can import notebook_utils, as run_tests.py does for the
+unittest suites.
+"""
+
+import sys
+from pathlib import Path
+
+tests_dir = str(Path(__file__).parent)
+if tests_dir not in sys.path:
+    sys.path.insert(0, tests_dir)
@@ -0,0 +1,80 @@
+"""
+Shared helpers for the notebook validation tests.
+
+Notebooks are parsed at most once per test run and the result is shared
+between every TestCase that inspects the same file.
+"""
+
+import functools
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+VOICE_MEMOS_NOTEBOOK = 'examples/Voice_memos.ipynb'
+MULTI_SPECTRAL_NOTEBOOK = 'examples/multi_spectral_remote_sensing.ipynb'
+
+HARDCODED_API_KEY_RE = re.compile(r'api_key\s*=\s*["\'][A-Za-z0-9_-]{30,}["\']')
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def load_json(path: str) -> Any:
+    """Load and parse a JSON file, caching the result by path."""
+    return loads(Path(path).read_bytes())
+
+
+def load_notebook(path: str) -> Dict[str, Any]:
+    """Load and parse the notebook JSON, caching the result by path."""
+    return load_json(path)
+
+
+def join_source(source: Any) -> str:
+    """Return a cell source as one string, whether stored as lines or text."""
+    return ''.join(source) if isinstance(source, list) else source
+
+
+@functools.lru_cache(maxsize=None)
+def cells_by_type(path: str) -> Dict[str, Tuple[Dict[str, Any], ...]]:
+    """Group the notebook's cells by cell type in a single pass."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for cell in load_notebook(path)['cells']:
+        groups.setdefault(cell.get('cell_type'), []).append(cell)
+    return {cell_type: tuple(cells) for cell_type, cells in groups.items()}
+
+
+def cells_of_type(path: str, cell_type: str) -> Tuple[Dict[str, Any], ...]:
+    """Return every cell of the given type, in notebook order."""
+    return cells_by_type(path).get(cell_type, ())
+
+
+@functools.lru_cache(maxsize=None)
+def cell_sources(path: str, cell_type: str) -> Tuple[str, ...]:
+    """Return the joined source of every cell of the given type."""
+    return tuple(
+        join_source(cell.get('source', []))
+        for cell in cells_of_type(path, cell_type)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def lower_cell_sources(path: str, cell_type: str) -> Tuple[str, ...]:
+    """Return cell_sources() lowercased, for case-insensitive scans."""
+    return tuple(source.lower() for source in cell_sources(path, cell_type))
+
+
+@functools.lru_cache(maxsize=None)
+def notebook_text(path: str, cell_type: str) -> str:
+    """Return the sources of all cells of the given type as one string."""
+    return '\n'.join(cell_sources(path, cell_type))
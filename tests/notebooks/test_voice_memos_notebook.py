@@ -5,26 +5,45 @@ This test suite validates the notebook structure, API usage patterns,
 and ensures the migration from google-genai to google-generativeai is correct.
 """
 
-import json
-import re
 import pytest
 from pathlib import Path
 
+from notebook_utils import VOICE_MEMOS_NOTEBOOK, join_source, load_notebook
+
+NOTEBOOK_PATH = Path(VOICE_MEMOS_NOTEBOOK)
+REQUIRED_NOTEBOOK_KEYS = frozenset({"cells", "metadata", "nbformat"})
+
+
+@pytest.fixture(scope="module")
+def notebook_path():
+    """Path to the Voice_memos notebook"""
+    return NOTEBOOK_PATH
+
+
+@pytest.fixture(scope="module")
+def notebook_content(notebook_path):
+    """Load notebook content"""
+    return load_notebook(str(notebook_path))
+
+
+@pytest.fixture(scope="module")
+def code_sources(notebook_content):
+    """Joined source of every code cell, in notebook order"""
+    return tuple(
+        join_source(cell.get("source", [])) for cell in notebook_content["cells"]
+        if cell.get("cell_type") == "code"
+    )
+
+
+@pytest.fixture(scope="module")
+def all_code(code_sources):
+    """Every code cell joined on newlines, so matches cannot span cells"""
+    return "\n".join(code_sources)
+
 
 class TestVoiceMemosNotebook:
     """Test suite for Voice_memos.ipynb"""
     
-    @pytest.fixture
-    def notebook_path(self):
-        """Path to the Voice_memos notebook"""
-        return Path("examples/Voice_memos.ipynb")
-    
-    @pytest.fixture
-    def notebook_content(self, notebook_path):
-        """Load notebook content"""
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    
     def test_notebook_exists(self, notebook_path):
         """Test that the Voice_memos notebook file exists"""
         assert notebook_path.exists(), f"Notebook not found at {notebook_path}"
@@ -32,62 +51,41 @@ class TestVoiceMemosNotebook:
     
     def test_notebook_structure(self, notebook_content):
         """Test that notebook has valid structure"""
-        assert "cells" in notebook_content, "Notebook missing 'cells' key"
-        assert "metadata" in notebook_content, "Notebook missing 'metadata' key"
-        assert "nbformat" in notebook_content, "Notebook missing 'nbformat' key"
+        missing = REQUIRED_NOTEBOOK_KEYS - notebook_content.keys()
+        assert not missing, f"Notebook missing keys: {sorted(missing)}"
         assert isinstance(notebook_content["cells"], list), "Cells should be a list"
     
-    def test_uses_correct_api_library(self, notebook_content):
+    def test_uses_correct_api_library(self, all_code):
         """Test that notebook uses google.generativeai (not google-genai)"""
-        code_cells = [cell for cell in notebook_content["cells"] 
-                     if cell.get("cell_type") == "code"]
-        
-        source_text = ""
-        for cell in code_cells:
-            source = cell.get("source", [])
-            if isinstance(source, list):
-                source_text += "".join(source)
-            else:
-                source_text += source
-        
-        assert "google.generativeai" in source_text or "google-generativeai" in source_text, \
+        assert "google.generativeai" in all_code or "google-generativeai" in all_code, \
             "Notebook should use google.generativeai library"
-        assert "from google import genai" not in source_text, \
+        assert "from google import genai" not in all_code, \
             "Notebook should not use deprecated 'from google import genai'"
     
-    def test_pip_install_command(self, notebook_content):
+    def test_pip_install_command(self, code_sources):
         """Test that pip install uses correct package"""
-        code_cells = [cell for cell in notebook_content["cells"] 
-                     if cell.get("cell_type") == "code"]
-        
-        pip_commands = []
-        for cell in code_cells:
-            source = cell.get("source", [])
-            source_text = "".join(source) if isinstance(source, list) else source
-            if "%pip install" in source_text or "!pip install" in source_text:
-                pip_commands.append(source_text)
+        pip_commands = [
+            source_text for source_text in code_sources
+            if "%pip install" in source_text or "!pip install" in source_text
+        ]
         
         assert len(pip_commands) > 0, "Notebook should contain pip install command"
         
-        found_correct_package = False
-        for cmd in pip_commands:
-            if "google-generativeai>=0.7.2" in cmd:
-                found_correct_package = True
-                break
-        
-        assert found_correct_package, \
+        assert any("google-generativeai>=0.7.2" in cmd for cmd in pip_commands), \
             "Notebook should install 'google-generativeai>=0.7.2'"
     
-    def test_no_old_client_pattern(self, notebook_content):
+    def test_no_old_client_pattern(self, code_sources):
         """Test that old client initialization pattern is not used"""
-        code_cells = [cell for cell in notebook_content["cells"] 
-                     if cell.get("cell_type") == "code"]
-        
-        for cell in code_cells:
-            source = cell.get("source", [])
-            source_text = "".join(source) if isinstance(source, list) else source
-            
-            assert "client = genai.Client" not in source_text, \
-                "Notebook should not use deprecated client = genai.Client pattern"
-            assert "client.files.upload" not in source_text, \
-                "Notebook should not use deprecated client.files.upload pattern"
\ No newline at end of file
+        # Report the first code cell still using each old pattern
+        client_cell = next(
+            (i for i, text in enumerate(code_sources) if "client = genai.Client" in text),
+            None,
+        )
+        assert client_cell is None, \
+            f"Notebook should not use deprecated client = genai.Client pattern (code cell {client_cell})"
+        upload_cell = next(
+            (i for i, text in enumerate(code_sources) if "client.files.upload" in text),
+            None,
+        )
+        assert upload_cell is None, \
+            f"Notebook should not use deprecated client.files.upload pattern (code cell {upload_cell})"
\ No newline at end of file
@@ -2,12 +2,18 @@
 """
 Test runner for notebook validation tests.
 
+Test modules are independent and read-only, so each one runs in its own
+worker process.
+
 Usage:
-    python tests/run_tests.py
+    python tests/run_tests.py [-v]
 """
 
+import argparse
+import io
 import sys
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add tests directory to path
@@ -15,17 +21,41 @@ tests_dir = Path(__file__).parent
 sys.path.insert(0, str(tests_dir))
 
 
-def run_all_tests():
-    """Discover and run all tests."""
-    loader = unittest.TestLoader()
-    start_dir = tests_dir
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return 0 if result.wasSuccessful() else 1
+def run_module(module_name, verbosity=1):
+    """Run one test module and return its report and outcome."""
+    # Reports are buffered in memory and written once by the parent
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromName(module_name)
+    result = unittest.TextTestRunner(stream=stream, verbosity=verbosity).run(suite)
+    return stream.getvalue(), result.testsRun, result.wasSuccessful()
+
+
+def run_all_tests(verbosity=1):
+    """Run every tests/test_*.py module in parallel and report the combined result."""
+    module_names = sorted(path.stem for path in tests_dir.glob('test_*.py'))
+
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(
+            run_module, module_names, [verbosity] * len(module_names)
+        ))
+
+    sys.stderr.write(''.join(report for report, _, _ in results))
+
+    tests_run = sum(count for _, count, _ in results)
+    successful = all(ok for _, _, ok in results)
+    sys.stderr.write(
+        f"\nRan {tests_run} tests in {len(module_names)} modules: "
+        f"{'OK' if successful else 'FAILED'}\n"
+    )
+
+    return 0 if successful else 1
 
 
 if __name__ == '__main__':
-    sys.exit(run_all_tests())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='list every test as it runs'
+    )
+    args = parser.parse_args()
+    sys.exit(run_all_tests(verbosity=2 if args.verbose else 1))
@@ -4,10 +4,27 @@ Test suite for multi_spectral_remote_sensing.ipynb notebook.
 Validates the notebook content and verifies the typo fix.
 """
 
-import json
 from pathlib import Path
+import re
 import unittest
 
+from notebook_utils import (
+    MULTI_SPECTRAL_NOTEBOOK,
+    cell_sources,
+    load_notebook,
+    lower_cell_sources,
+)
+
+NOTEBOOK_PATH = Path(MULTI_SPECTRAL_NOTEBOOK)
+
+COMMON_TYPOS = [
+    'iamges',  # images
+    'teh',     # the
+    'adn',     # and
+    'recieve', # receive
+]
+COMMON_TYPOS_RE = re.compile('|'.join(map(re.escape, COMMON_TYPOS)))
+
 
 class TestMultiSpectralNotebook(unittest.TestCase):
     """Test suite for multi_spectral_remote_sensing.ipynb."""
@@ -15,12 +32,22 @@ class TestMultiSpectralNotebook(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test fixtures."""
-        cls.notebook_path = Path("examples/multi_spectral_remote_sensing.ipynb")
+        cls.notebook_path = NOTEBOOK_PATH
         if cls.notebook_path.exists():
-            with open(cls.notebook_path, 'r', encoding='utf-8') as f:
-                cls.notebook_content = json.load(f)
+            cls.notebook_content = load_notebook(MULTI_SPECTRAL_NOTEBOOK)
+            cls.markdown_sources = cell_sources(MULTI_SPECTRAL_NOTEBOOK, 'markdown')
+            cls.lower_markdown_sources = lower_cell_sources(
+                MULTI_SPECTRAL_NOTEBOOK, 'markdown'
+            )
         else:
             cls.notebook_content = None
+            cls.markdown_sources = ()
+            cls.lower_markdown_sources = ()
+        # Markdown cells for the section that had the 'iamges' typo
+        cls.remote_sensing_sections = tuple(
+            source for source in cls.markdown_sources
+            if 'Remote sensing with multi-spectral' in source
+        )
 
     def test_notebook_exists(self):
         """Test that the notebook file exists."""
@@ -43,24 +70,13 @@ class TestMultiSpectralNotebook(unittest.TestCase):
         if self.notebook_content is None:
             self.skipTest("Notebook not loaded")
         
-        markdown_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'markdown'
-        ]
-        
         # Check that the typo is fixed
-        typo_found = False
-        correct_spelling_found = False
-        
-        for cell in markdown_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Look for the specific section about multi-spectral images
-            if 'Remote sensing with multi-spectral' in source:
-                if 'iamges' in source:
-                    typo_found = True
-                if 'images' in source:
-                    correct_spelling_found = True
+        typo_found = any(
+            'iamges' in source for source in self.remote_sensing_sections
+        )
+        correct_spelling_found = any(
+            'images' in source for source in self.remote_sensing_sections
+        )
         
         self.assertFalse(
             typo_found,
@@ -76,25 +92,13 @@ class TestMultiSpectralNotebook(unittest.TestCase):
         if self.notebook_content is None:
             self.skipTest("Notebook not loaded")
         
-        common_typos = [
-            'iamges',  # images
-            'teh',     # the
-            'adn',     # and
-            'recieve', # receive
-        ]
-        
-        markdown_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'markdown'
-        ]
-        
         found_typos = []
         
-        for cell in markdown_cells:
-            source = ''.join(cell.get('source', [])).lower()
-            for typo in common_typos:
-                if typo in source:
-                    found_typos.append(typo)
+        for source in self.lower_markdown_sources:
+            # Record each distinct typo found in the cell
+            found_typos.extend(
+                dict.fromkeys(m.group() for m in COMMON_TYPOS_RE.finditer(source))
+            )
         
         self.assertEqual(
             len(found_typos), 0,
@@ -106,21 +110,9 @@ class TestMultiSpectralNotebook(unittest.TestCase):
         if self.notebook_content is None:
             self.skipTest("Notebook not loaded")
         
-        markdown_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'markdown'
-        ]
-        
         # Should have at least some headings
-        heading_count = 0
-        
-        for cell in markdown_cells:
-            source = ''.join(cell.get('source', []))
-            if source.strip().startswith('#'):
-                heading_count += 1
-        
-        self.assertGreater(
-            heading_count, 0,
+        self.assertTrue(
+            any(source.lstrip().startswith('#') for source in self.markdown_sources),
             "Notebook should have markdown headings"
         )
 
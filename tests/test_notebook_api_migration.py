@@ -5,51 +5,59 @@ Ensures that notebooks properly migrate from google-genai to
 google-generativeai SDK with correct API patterns.
 """
 
-import json
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
 import unittest
 
+from notebook_utils import (
+    HARDCODED_API_KEY_RE,
+    VOICE_MEMOS_NOTEBOOK,
+    cell_sources,
+    notebook_text,
+)
 
+NOTEBOOK_PATH = Path(VOICE_MEMOS_NOTEBOOK)
+
+# Both classes inspect the Voice memos notebook and skip without it
+requires_notebook = unittest.skipUnless(
+    NOTEBOOK_PATH.exists(), f"Notebook not found: {NOTEBOOK_PATH}"
+)
+
+VERSION_RE = re.compile(r'google-generativeai>=(\d+\.\d+\.\d+)')
+TIMEOUT_RE = re.compile(r'timeout["\']?\s*:\s*(\d+)')
+DEPRECATED_CONFIG_RE = re.compile(
+    '|'.join(map(re.escape, ['thinking_config', 'ThinkingConfig', 'thinking_budget']))
+)
+
+
+@requires_notebook
 class TestNotebookAPIMigration(unittest.TestCase):
     """Test API migration patterns in notebooks."""
 
     API_MIGRATION_PATTERNS = {
-        'old_import': r'from google import genai',
-        'new_import': r'import google\.generativeai as genai',
-        'old_client': r'client\s*=\s*genai\.Client\(',
-        'new_configure': r'genai\.configure\(api_key=',
-        'old_upload': r'client\.files\.upload\(file=',
-        'new_upload': r'genai\.upload_file\(path=',
-        'old_generate': r'client\.models\.generate_content\(',
-        'new_model_init': r'genai\.GenerativeModel\(',
-        'new_generate': r'model\.generate_content\(',
+        name: re.compile(pattern) for name, pattern in {
+            'old_import': r'from google import genai',
+            'new_import': r'import google\.generativeai as genai',
+            'old_client': r'client\s*=\s*genai\.Client\(',
+            'new_configure': r'genai\.configure\(api_key=',
+            'old_upload': r'client\.files\.upload\(file=',
+            'new_upload': r'genai\.upload_file\(path=',
+            'old_generate': r'client\.models\.generate_content\(',
+            'new_model_init': r'genai\.GenerativeModel\(',
+            'new_generate': r'model\.generate_content\(',
+        }.items()
     }
 
     def test_voice_memos_migration_complete(self):
         """Test that Voice_memos.ipynb has complete API migration."""
-        notebook_path = Path("examples/Voice_memos.ipynb")
-        
-        if not notebook_path.exists():
-            self.skipTest(f"Notebook not found: {notebook_path}")
-        
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-        
-        code_cells = [
-            ''.join(cell.get('source', []))
-            for cell in notebook['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        all_code = '\n'.join(code_cells)
+        all_code = notebook_text(VOICE_MEMOS_NOTEBOOK, 'code')
         
         # Check that old patterns are NOT present
-        old_patterns_found = []
-        for pattern_name in ['old_import', 'old_client', 'old_upload', 'old_generate']:
-            if re.search(self.API_MIGRATION_PATTERNS[pattern_name], all_code):
-                old_patterns_found.append(pattern_name)
+        old_patterns_found = [
+            pattern_name
+            for pattern_name in ['old_import', 'old_client', 'old_upload', 'old_generate']
+            if self.API_MIGRATION_PATTERNS[pattern_name].search(all_code)
+        ]
         
         self.assertEqual(
             len(old_patterns_found), 0,
@@ -57,11 +65,12 @@ class TestNotebookAPIMigration(unittest.TestCase):
         )
         
         # Check that new patterns ARE present
-        new_patterns_missing = []
-        for pattern_name in ['new_import', 'new_configure', 'new_upload', 
-                            'new_model_init', 'new_generate']:
-            if not re.search(self.API_MIGRATION_PATTERNS[pattern_name], all_code):
-                new_patterns_missing.append(pattern_name)
+        new_patterns_missing = [
+            pattern_name
+            for pattern_name in ['new_import', 'new_configure', 'new_upload',
+                                 'new_model_init', 'new_generate']
+            if not self.API_MIGRATION_PATTERNS[pattern_name].search(all_code)
+        ]
         
         self.assertEqual(
             len(new_patterns_missing), 0,
@@ -70,19 +79,7 @@ class TestNotebookAPIMigration(unittest.TestCase):
 
     def test_package_version_consistency(self):
         """Test that package versions are consistent."""
-        notebook_path = Path("examples/Voice_memos.ipynb")
-        
-        if not notebook_path.exists():
-            self.skipTest(f"Notebook not found: {notebook_path}")
-        
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-        
-        code_cells = [
-            ''.join(cell.get('source', []))
-            for cell in notebook['cells']
-            if cell.get('cell_type') == 'code'
-        ]
+        code_cells = cell_sources(VOICE_MEMOS_NOTEBOOK, 'code')
         
         # Check for version specifications
         for cell_code in code_cells:
@@ -96,10 +93,7 @@ class TestNotebookAPIMigration(unittest.TestCase):
             # If installing generativeai, check version
             if 'google-generativeai' in cell_code:
                 # Should specify minimum version
-                version_match = re.search(
-                    r'google-generativeai>=(\d+\.\d+\.\d+)',
-                    cell_code
-                )
+                version_match = VERSION_RE.search(cell_code)
                 if version_match:
                     version = version_match.group(1)
                     major, minor, patch = map(int, version.split('.'))
@@ -112,19 +106,7 @@ class TestNotebookAPIMigration(unittest.TestCase):
 
     def test_api_key_handling(self):
         """Test that API key handling follows security best practices."""
-        notebook_path = Path("examples/Voice_memos.ipynb")
-        
-        if not notebook_path.exists():
-            self.skipTest(f"Notebook not found: {notebook_path}")
-        
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-        
-        code_cells = [
-            ''.join(cell.get('source', []))
-            for cell in notebook['cells']
-            if cell.get('cell_type') == 'code'
-        ]
+        code_cells = cell_sources(VOICE_MEMOS_NOTEBOOK, 'code')
         
         for cell_code in code_cells:
             # API key should come from userdata
@@ -138,25 +120,13 @@ class TestNotebookAPIMigration(unittest.TestCase):
             # Should not have hardcoded keys
             self.assertNotRegex(
                 cell_code,
-                r'api_key\s*=\s*["\'][A-Za-z0-9_-]{30,}["\']',
+                HARDCODED_API_KEY_RE,
                 "API keys should not be hardcoded"
             )
 
     def test_file_handling_migration(self):
         """Test that file handling follows new API patterns."""
-        notebook_path = Path("examples/Voice_memos.ipynb")
-        
-        if not notebook_path.exists():
-            self.skipTest(f"Notebook not found: {notebook_path}")
-        
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-        
-        code_cells = [
-            ''.join(cell.get('source', []))
-            for cell in notebook['cells']
-            if cell.get('cell_type') == 'code'
-        ]
+        code_cells = cell_sources(VOICE_MEMOS_NOTEBOOK, 'code')
         
         for cell_code in code_cells:
             # Check file upload patterns
@@ -169,27 +139,15 @@ class TestNotebookAPIMigration(unittest.TestCase):
                 )
                 
                 # Should not use old file parameter
-                self.assertNotRegex(
+                self.assertNotIn(
+                    '.upload(file=',
                     cell_code,
-                    r'\.upload\(file=',
                     "Should not use old 'file=' parameter syntax"
                 )
 
     def test_model_initialization_pattern(self):
         """Test that model initialization follows new patterns."""
-        notebook_path = Path("examples/Voice_memos.ipynb")
-        
-        if not notebook_path.exists():
-            self.skipTest(f"Notebook not found: {notebook_path}")
-        
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-        
-        code_cells = [
-            ''.join(cell.get('source', []))
-            for cell in notebook['cells']
-            if cell.get('cell_type') == 'code'
-        ]
+        code_cells = cell_sources(VOICE_MEMOS_NOTEBOOK, 'code')
         
         model_init_found = False
         generate_content_found = False
@@ -207,7 +165,7 @@ class TestNotebookAPIMigration(unittest.TestCase):
                 )
             
             # Check for generate_content call on model instance
-            if re.search(r'model\.generate_content\(', cell_code):
+            if 'model.generate_content(' in cell_code:
                 generate_content_found = True
         
         self.assertTrue(
@@ -220,54 +178,25 @@ class TestNotebookAPIMigration(unittest.TestCase):
         )
 
 
+@requires_notebook
 class TestNotebookCodeQuality(unittest.TestCase):
     """Test code quality and best practices in notebooks."""
 
     def test_no_deprecated_config_options(self):
         """Test that notebooks don't use deprecated configuration options."""
-        notebook_path = Path("examples/Voice_memos.ipynb")
-        
-        if not notebook_path.exists():
-            self.skipTest(f"Notebook not found: {notebook_path}")
-        
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-        
-        deprecated_patterns = [
-            'thinking_config',
-            'ThinkingConfig',
-            'thinking_budget',
-        ]
-        
-        code_cells = [
-            ''.join(cell.get('source', []))
-            for cell in notebook['cells']
-            if cell.get('cell_type') == 'code'
-        ]
+        code_cells = cell_sources(VOICE_MEMOS_NOTEBOOK, 'code')
         
         for cell_code in code_cells:
-            for pattern in deprecated_patterns:
-                self.assertNotIn(
-                    pattern,
-                    cell_code,
-                    f"Should not use deprecated config option: {pattern}"
+            # One pass per cell covers every deprecated option
+            match = DEPRECATED_CONFIG_RE.search(cell_code)
+            if match:
+                self.fail(
+                    f"Should not use deprecated config option: {match.group()}"
                 )
 
     def test_timeout_configuration(self):
         """Test that timeouts are properly configured."""
-        notebook_path = Path("examples/Voice_memos.ipynb")
-        
-        if not notebook_path.exists():
-            self.skipTest(f"Notebook not found: {notebook_path}")
-        
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = json.load(f)
-        
-        code_cells = [
-            ''.join(cell.get('source', []))
-            for cell in notebook['cells']
-            if cell.get('cell_type') == 'code'
-        ]
+        code_cells = cell_sources(VOICE_MEMOS_NOTEBOOK, 'code')
         
         timeout_configured = False
         
@@ -277,7 +206,7 @@ class TestNotebookCodeQuality(unittest.TestCase):
                 timeout_configured = True
                 
                 # Extract timeout value if possible
-                timeout_match = re.search(r'timeout["\']?\s*:\s*(\d+)', cell_code)
+                timeout_match = TIMEOUT_RE.search(cell_code)
                 if timeout_match:
                     timeout_value = int(timeout_match.group(1))
                     self.assertGreater(
@@ -6,28 +6,54 @@ google-generativeai SDK, ensuring all API calls are correctly updated
 and the notebook executes without errors.
 """
 
-import json
-import os
 import re
 from pathlib import Path
-from typing import Dict, List, Any
 import unittest
 
+from notebook_utils import (
+    HARDCODED_API_KEY_RE,
+    VOICE_MEMOS_NOTEBOOK,
+    cell_sources,
+    cells_by_type,
+    cells_of_type,
+    load_notebook,
+    notebook_text,
+)
 
-class TestVoiceMemosNotebook(unittest.TestCase):
-    """Test suite for Voice_memos.ipynb notebook validation."""
+SYSTEM_INSTRUCTION_RE = re.compile(r'si\s*=\s*["\']')
+THINKING_CONFIG_RE = re.compile(r'thinking_config|ThinkingConfig')
+
+NOTEBOOK_PATH = Path(VOICE_MEMOS_NOTEBOOK)
+
+
+class VoiceMemosTestCase(unittest.TestCase):
+    """Shared fixtures for the Voice_memos.ipynb test classes."""
+
+    # Derived views are built on first use by a test that needs them and
+    # cached by notebook_utils, so filtered runs skip the unused ones.
+    notebook_path = NOTEBOOK_PATH
+
+    @property
+    def notebook_content(self):
+        return load_notebook(VOICE_MEMOS_NOTEBOOK)
 
-    @classmethod
-    def setUpClass(cls):
-        """Set up test fixtures."""
-        cls.notebook_path = Path("examples/Voice_memos.ipynb")
-        cls.notebook_content = cls._load_notebook()
+    @property
+    def code_cells(self):
+        return cells_of_type(VOICE_MEMOS_NOTEBOOK, 'code')
 
-    @classmethod
-    def _load_notebook(cls) -> Dict[str, Any]:
-        """Load and parse the notebook JSON."""
-        with open(cls.notebook_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    @property
+    def code_sources(self):
+        return cell_sources(VOICE_MEMOS_NOTEBOOK, 'code')
+
+    # None of the checked markers span lines, so searching the joined
+    # code cells is equivalent to checking each cell separately.
+    @property
+    def code_text(self):
+        return notebook_text(VOICE_MEMOS_NOTEBOOK, 'code')
+
+
+class TestVoiceMemosNotebook(VoiceMemosTestCase):
+    """Test suite for Voice_memos.ipynb notebook validation."""
 
     def test_notebook_file_exists(self):
         """Test that the Voice_memos notebook file exists."""
@@ -50,316 +76,125 @@ class TestVoiceMemosNotebook(unittest.TestCase):
             "Notebook should contain at least one cell"
         )
         
-        # Check for required cell types
-        cell_types = [cell.get('cell_type') for cell in cells]
+        # Check for required cell types against the prebuilt type index
+        cell_types = cells_by_type(VOICE_MEMOS_NOTEBOOK)
         self.assertIn('code', cell_types, "Notebook should have code cells")
         self.assertIn('markdown', cell_types, "Notebook should have markdown cells")
 
     def test_google_generativeai_import(self):
         """Test that the notebook uses the correct google-generativeai import."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        import_found = False
-        old_import_found = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Check for new import
-            if 'import google.generativeai as genai' in source:
-                import_found = True
-            
-            # Check that old import is not present
-            if 'from google import genai' in source:
-                old_import_found = True
-        
         self.assertTrue(
-            import_found,
+            'import google.generativeai as genai' in self.code_text,
             "Notebook should import google.generativeai as genai"
         )
         self.assertFalse(
-            old_import_found,
+            'from google import genai' in self.code_text,
             "Notebook should not use old 'from google import genai' import"
         )
 
     def test_pip_install_command_updated(self):
         """Test that pip install uses correct package version."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        correct_install = False
-        old_install = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Check for new package
-            if 'google-generativeai>=0.7.2' in source:
-                correct_install = True
-            
-            # Check for old package
-            if 'google-genai>=1.0.0' in source:
-                old_install = True
-        
         self.assertTrue(
-            correct_install,
+            'google-generativeai>=0.7.2' in self.code_text,
             "Should install google-generativeai>=0.7.2"
         )
         self.assertFalse(
-            old_install,
+            'google-genai>=1.0.0' in self.code_text,
             "Should not reference old google-genai package"
         )
 
     def test_api_configuration_method(self):
         """Test that genai.configure is used instead of Client initialization."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        configure_found = False
-        client_init_found = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Check for new configuration method
-            if 'genai.configure(api_key=' in source:
-                configure_found = True
-            
-            # Check that old client init is not present
-            if 'client = genai.Client(' in source:
-                client_init_found = True
-        
         self.assertTrue(
-            configure_found,
+            'genai.configure(api_key=' in self.code_text,
             "Should use genai.configure() for API key setup"
         )
         self.assertFalse(
-            client_init_found,
+            'client = genai.Client(' in self.code_text,
             "Should not use old Client() initialization"
         )
 
     def test_file_upload_api_migration(self):
         """Test that file upload uses new API (genai.upload_file)."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        new_upload_api = False
-        old_upload_api = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Check for new upload API
-            if 'genai.upload_file(path=' in source:
-                new_upload_api = True
-            
-            # Check for old upload API
-            if 'client.files.upload(file=' in source:
-                old_upload_api = True
-        
         self.assertTrue(
-            new_upload_api,
+            'genai.upload_file(path=' in self.code_text,
             "Should use genai.upload_file() for file uploads"
         )
         self.assertFalse(
-            old_upload_api,
+            'client.files.upload(file=' in self.code_text,
             "Should not use old client.files.upload() method"
         )
 
     def test_model_initialization(self):
         """Test that GenerativeModel is properly initialized."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        model_init_found = False
-        old_model_call = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Check for new model initialization
-            if 'genai.GenerativeModel(' in source:
-                model_init_found = True
-            
-            # Check for old model call pattern
-            if 'client.models.generate_content(' in source:
-                old_model_call = True
-        
         self.assertTrue(
-            model_init_found,
+            'genai.GenerativeModel(' in self.code_text,
             "Should use genai.GenerativeModel() for model initialization"
         )
         self.assertFalse(
-            old_model_call,
+            'client.models.generate_content(' in self.code_text,
             "Should not use old client.models.generate_content() pattern"
         )
 
     def test_generate_content_method(self):
         """Test that generate_content is called on model instance."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        correct_pattern = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Check for model.generate_content() pattern
-            if re.search(r'model\.generate_content\(', source):
-                correct_pattern = True
-                break
-        
         self.assertTrue(
-            correct_pattern,
+            'model.generate_content(' in self.code_text,
             "Should call generate_content() on model instance"
         )
 
     def test_no_thinking_config_in_migrated_code(self):
         """Test that old thinking_config is removed."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        thinking_config_found = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            if 'thinking_config' in source or 'ThinkingConfig' in source:
-                thinking_config_found = True
-                break
-        
         self.assertFalse(
-            thinking_config_found,
+            THINKING_CONFIG_RE.search(self.code_text),
             "Should not contain old thinking_config or ThinkingConfig"
         )
 
     def test_request_options_usage(self):
         """Test that request_options is used for timeout configuration."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        request_options_found = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            if 'request_options' in source and 'timeout' in source:
-                request_options_found = True
-                break
-        
+        # Both markers must appear in the same cell
         self.assertTrue(
-            request_options_found,
+            any(
+                'request_options' in source and 'timeout' in source
+                for source in self.code_sources
+            ),
             "Should use request_options for timeout configuration"
         )
 
     def test_execution_count_cleared(self):
         """Test that execution counts are cleared (set to null)."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
         # Check that most execution counts are null
-        null_counts = sum(
-            1 for cell in code_cells
-            if cell.get('execution_count') is None
-        )
-        
-        self.assertGreater(
-            null_counts, 0,
+        self.assertTrue(
+            any(cell.get('execution_count') is None for cell in self.code_cells),
             "At least some cells should have null execution_count"
         )
 
     def test_outputs_cleared(self):
         """Test that cell outputs are appropriately cleared."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
         # Most cells should have empty outputs after cleanup
-        empty_outputs = sum(
-            1 for cell in code_cells
-            if not cell.get('outputs', [])
-        )
-        
-        self.assertGreater(
-            empty_outputs, 0,
+        self.assertTrue(
+            any(not cell.get('outputs', []) for cell in self.code_cells),
             "Most cells should have cleared outputs"
         )
 
     def test_system_instruction_variable(self):
         """Test that system instruction variable is properly defined."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        si_variable_found = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            if re.search(r'si\s*=\s*["\']', source):
-                si_variable_found = True
-                break
-        
         self.assertTrue(
-            si_variable_found,
+            any(SYSTEM_INSTRUCTION_RE.search(source) for source in self.code_sources),
             "Should define system instruction variable (si)"
         )
 
     def test_model_name_format(self):
         """Test that model name uses correct format."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        correct_model_format = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            # Check for models/ prefix
-            if 'models/gemini' in source:
-                correct_model_format = True
-                break
-        
+        # Check for models/ prefix
         self.assertTrue(
-            correct_model_format,
+            'models/gemini' in self.code_text,
             "Should use 'models/gemini-*' format for model name"
         )
 
     def test_wget_command_format(self):
         """Test that wget commands are properly formatted."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        wget_cells = []
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            if '!wget' in source:
-                wget_cells.append(source)
+        wget_cells = [source for source in self.code_sources if '!wget' in source]
         
         # Should have wget commands without -q flag (for visibility)
         self.assertGreater(
@@ -367,32 +202,20 @@ class TestVoiceMemosNotebook(unittest.TestCase):
             "Should have wget download commands"
         )
         
-        # Check format
-        for wget_cell in wget_cells:
-            # Should have proper URL format
-            self.assertIn(
-                'storage.googleapis.com',
-                wget_cell,
-                "wget commands should download from storage.googleapis.com"
-            )
+        # Check format: every wget cell should use a proper URL
+        bad_cell = next(
+            (cell for cell in wget_cells if 'storage.googleapis.com' not in cell),
+            None,
+        )
+        self.assertIsNone(
+            bad_cell,
+            "wget commands should download from storage.googleapis.com"
+        )
 
     def test_apt_install_format(self):
         """Test that apt install command is properly formatted."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        apt_install_found = False
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            if '!apt install poppler-utils' in source:
-                apt_install_found = True
-                break
-        
         self.assertTrue(
-            apt_install_found,
+            '!apt install poppler-utils' in self.code_text,
             "Should have apt install command for poppler-utils"
         )
 
@@ -414,18 +237,11 @@ class TestVoiceMemosNotebook(unittest.TestCase):
 
     def test_no_hardcoded_api_keys(self):
         """Test that no API keys are hardcoded in the notebook."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
+        for source in self.code_sources:
             # Check for potential API key patterns
             self.assertNotRegex(
                 source,
-                r'api_key\s*=\s*["\'][A-Za-z0-9_-]{30,}["\']',
+                HARDCODED_API_KEY_RE,
                 "Should not contain hardcoded API keys"
             )
             
@@ -438,45 +254,20 @@ class TestVoiceMemosNotebook(unittest.TestCase):
                 )
 
 
-class TestVoiceMemosNotebookIntegration(unittest.TestCase):
+class TestVoiceMemosNotebookIntegration(VoiceMemosTestCase):
     """Integration tests for Voice_memos notebook API usage patterns."""
 
-    @classmethod
-    def setUpClass(cls):
-        """Set up test fixtures."""
-        cls.notebook_path = Path("examples/Voice_memos.ipynb")
-        with open(cls.notebook_path, 'r', encoding='utf-8') as f:
-            cls.notebook_content = json.load(f)
-
     def test_api_workflow_sequence(self):
         """Test that API calls follow correct sequence."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
+        code = self.code_text
         workflow_steps = {
-            'import': False,
-            'configure': False,
-            'upload': False,
-            'model_init': False,
-            'generate': False
+            'import': 'import google.generativeai' in code,
+            'configure': 'genai.configure' in code,
+            'upload': 'genai.upload_file' in code,
+            'model_init': 'genai.GenerativeModel' in code,
+            'generate': 'generate_content' in code,
         }
         
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
-            if 'import google.generativeai' in source:
-                workflow_steps['import'] = True
-            if 'genai.configure' in source:
-                workflow_steps['configure'] = True
-            if 'genai.upload_file' in source:
-                workflow_steps['upload'] = True
-            if 'genai.GenerativeModel' in source:
-                workflow_steps['model_init'] = True
-            if 'generate_content' in source:
-                workflow_steps['generate'] = True
-        
         # All workflow steps should be present
         for step, found in workflow_steps.items():
             self.assertTrue(
@@ -486,14 +277,7 @@ class TestVoiceMemosNotebookIntegration(unittest.TestCase):
 
     def test_file_upload_parameters(self):
         """Test that file upload calls use correct parameter names."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
+        for source in self.code_sources:
             # If upload_file is called, check parameter name
             if 'genai.upload_file' in source:
                 self.assertIn(
@@ -509,14 +293,7 @@ class TestVoiceMemosNotebookIntegration(unittest.TestCase):
 
     def test_model_configuration_parameters(self):
         """Test that model is configured with correct parameters."""
-        code_cells = [
-            cell for cell in self.notebook_content['cells']
-            if cell.get('cell_type') == 'code'
-        ]
-        
-        for cell in code_cells:
-            source = ''.join(cell.get('source', []))
-            
+        for source in self.code_sources:
             # Check GenerativeModel parameters
             if 'GenerativeModel(' in source:
                 self.assertIn(